@@ -1,4 +1,5 @@
 import arcade
+import gc
 import math
 import random
 import time
@@ -13,6 +14,7 @@ import os
 SCREEN_WIDTH, SCREEN_HEIGHT = 1250, 800
 SCREEN_TITLE = "StoryQuest+++"
 ARENA_MARGIN, GROUND_Y, GRID_SPACING = 48, 56, 32
+BOSS_BAR_W = 460
 
 # ---------------------------------------------------------------------------
 # Player base stats
@@ -24,6 +26,13 @@ PLAYER_BASE_SPEED, PLAYER_BASE_DASH_SPEED = 4.0, 12.0
 PLAYER_DASH_TIME, PLAYER_DASH_IFRAME, PLAYER_DASH_CD = 0.18, 0.5, 1.2
 MELEE_CD, MELEE_RANGE, MELEE_DAMAGE = 0.5, 46, 7
 
+# Movement lookup: (up, down, left, right) key flags -> (dx, dy, speed scale).
+# Opposing keys cancel out; diagonals get the 1/sqrt(2) scale.
+MOVE_TABLE = {
+    (u, d, l, r): (r - l, u - d, 0.7071 if (r - l) and (u - d) else 1.0)
+    for u in (0, 1) for d in (0, 1) for l in (0, 1) for r in (0, 1)
+}
+
 # ---------------------------------------------------------------------------
 # Weapon base stats
 #  - Define projectile behavior and firing pace.
@@ -31,6 +40,7 @@ MELEE_CD, MELEE_RANGE, MELEE_DAMAGE = 0.5, 46, 7
 # ---------------------------------------------------------------------------
 BASE_BULLET_SPEED, BASE_FIRE_CD, BASE_DAMAGE = 11.5, 0.26, 3
 SHOTGUN_SPREAD, SHOTGUN_PELLETS = math.radians(6), 4
+BOSS_FAN_SPREAD = math.radians(90)
 
 # ---------------------------------------------------------------------------
 # XP / Progression
@@ -40,6 +50,20 @@ SHOTGUN_SPREAD, SHOTGUN_PELLETS = math.radians(6), 4
 XP_PER_WAVE_CLEAR, XP_ORB_VALUE, XP_TO_LEVEL_BASE = 6, 1, 5
 TOTAL_WAVES = 5
 
+# ---------------------------------------------------------------------------
+# Effects
+#  - Hard budget for live particles, so bursts of explosions keep frame time bounded.
+# ---------------------------------------------------------------------------
+MAX_PARTICLES = 128
+
+# ---------------------------------------------------------------------------
+# Garbage collection
+#  - Gameplay raises the collection thresholds so young-generation passes run rarer;
+#    every other view restores the interpreter defaults.
+# ---------------------------------------------------------------------------
+DEFAULT_GC_THRESHOLDS = gc.get_threshold()
+GAMEPLAY_GC_THRESHOLDS = (10000, 50, 50)
+
 # ---------------------------------------------------------------------------
 # Colors
 #  - Centralized palette for UI, backgrounds, effects, etc.
@@ -55,6 +79,9 @@ ELITE_BODY, ENEMY_OUT = arcade.color.LIGHT_RED_OCHRE, arcade.color.WHITE
 BOSS_BODY, BOSS_OUT = arcade.color.ORANGE_RED, arcade.color.WHITE
 HP_BAR_BACK, HP_BAR_GREEN = (0, 0, 0, 160), arcade.color.SPRING_BUD
 HP_BAR_RED, HP_BAR_YELLOW = arcade.color.PASTEL_RED, arcade.color.GOLD
+BOSS_SHOT_COLOR, BOSS_AIMED_COLOR = arcade.color.LIGHT_CORAL, arcade.color.PURPLE
+HIT_SPARK, SLASH_SPARK = arcade.color.GOLD, arcade.color.LIGHT_CYAN
+DEATH_SPARK, BOSS_BLAST = arcade.color.BANGLADESH_GREEN, arcade.color.ORANGE
 
 # ---------------------------------------------------------------------------
 # Asset path helper
@@ -68,16 +95,115 @@ def asset(*path):
     return os.path.join(ASSET_DIR, *path)
 
 
+# ---------------------------------------------------------------------------
+# Shared textures
+#  - Built/loaded once and reused by every sprite of the same kind, so spawning
+#    never rasterizes a new circle or re-resolves an image path.
+#  - CIRCLE_TEXTURE is white; circle sprites tint it via .color and size it via scale.
+# ---------------------------------------------------------------------------
+CIRCLE_TEXTURE_RADIUS = 16
+CIRCLE_TEXTURE = arcade.make_circle_texture(CIRCLE_TEXTURE_RADIUS * 2, arcade.color.WHITE)
+_TEXTURES = {}
+
+
+def texture(name):
+    """Return the Texture for an image in ASSET_DIR, loading it on first use."""
+    tex = _TEXTURES.get(name)
+    if tex is None:
+        tex = _TEXTURES[name] = arcade.load_texture(asset(name))
+    return tex
+
+
+_HIT_RADII = {}
+
+
+def hit_radius(sprite):
+    """
+    Radius of the circle around the sprite's hit-box polygon, in world pixels.
+    - The unscaled radius is cached per texture (keyed by id; textures live in _TEXTURES forever).
+    - The circle bounds the polygon, so use it only to reject far-apart pairs cheaply;
+      confirm a hit with arcade.check_for_collision.
+    """
+    tex = sprite.texture
+    r = _HIT_RADII.get(id(tex))
+    if r is None:
+        r = _HIT_RADII[id(tex)] = max(math.hypot(x, y) for x, y in tex.hit_box_points)
+    return r * sprite.scale_x
+
+
 
 # Small helpers for math / coord handling
 
 # snap() forces coordinates to integers for cleaner rendering (no subpixel jitter).
-snap = lambda v: float(int(round(v)))
+# round() of a float already returns an int, so no int() step is needed.
+snap = lambda v: float(round(v))
 
 
-def dist(x1, y1, x2, y2):
-    """Euclidean distance helper, used for XP magnet, melee range, etc."""
-    return math.hypot(x2 - x1, y2 - y1)
+def arena_clamp(sprite, x, y):
+    """
+    Return (x, y) moved so the sprite's box at that center stays inside the arena.
+    - Lets callers write the position once instead of poking left/right/top/bottom.
+    """
+    hw, hh = sprite.width / 2, sprite.height / 2
+    x = min(max(x, ARENA_MARGIN + hw), SCREEN_WIDTH - ARENA_MARGIN - hw)
+    y = min(max(y, GROUND_Y + hh), SCREEN_HEIGHT - ARENA_MARGIN - hh)
+    return x, y
+
+
+_FAN_OFFSETS = {}
+
+
+def fan_offsets(count, spread):
+    """
+    Unit vectors for count shots spread evenly across `spread` radians, centered on angle 0.
+    - Cached per (count, spread); callers rotate them onto their aim direction.
+    """
+    dirs = _FAN_OFFSETS.get((count, spread))
+    if dirs is None:
+        step = spread / (count - 1)
+        dirs = _FAN_OFFSETS[(count, spread)] = tuple(
+            (math.cos(step * i - spread / 2), math.sin(step * i - spread / 2)) for i in range(count))
+    return dirs
+
+
+_RING_DIRS = {}
+
+
+def ring_dirs(count):
+    """Unit vectors for count shots spaced evenly around a full circle, cached per count."""
+    dirs = _RING_DIRS.get(count)
+    if dirs is None:
+        step = math.tau / count
+        dirs = _RING_DIRS[count] = tuple((math.cos(step * i), math.sin(step * i)) for i in range(count))
+    return dirs
+
+
+def circles_touch(ax, ay, ar, bx, by, br):
+    """True if circles (ax, ay, ar) and (bx, by, br) overlap; no sqrt, no polygon test."""
+    dx, dy, r = ax - bx, ay - by, ar + br
+    return dx * dx + dy * dy <= r * r
+
+
+def bullet_hits(sprite, bullets, out=None):
+    """
+    Return the bullets that touch the sprite's hit-box polygon.
+    - Broad phase: spatial-hash cells near the sprite, then a circle reject using hit_r.
+    - Narrow phase: arcade.check_for_collision against the sprite's hit box.
+    - If `out` is given it is cleared and refilled, so per-frame callers can reuse one list.
+    """
+    x, y, r = sprite.center_x, sprite.center_y, sprite.hit_r
+    sh = bullets.spatial_hash
+    near = sh.get_sprites_near_rect(arcade.LRBT(x - r, x + r, y - r, y + r)) if sh else bullets
+    if out is None:
+        hits = []
+    else:
+        hits = out
+        hits.clear()
+    for b in near:
+        dx, dy, rr = b.center_x - x, b.center_y - y, r + b.radius
+        if dx * dx + dy * dy <= rr * rr and arcade.check_for_collision(sprite, b):
+            hits.append(b)
+    return hits
 
 
 class Timer:
@@ -85,21 +211,25 @@ class Timer:
     Generic cooldown timer.
     - Used for shooting, dashing, melee, etc.
     - Encapsulates 'is this action ready yet?' logic.
+    - Stores a deadline on the caller's game clock (now), so it needs no per-frame ticking
+      and stands still whenever that clock does (pause, intro, perk draft).
     """
+    __slots__ = ("cd", "ready_at")
+
     def __init__(self, cd=0.0):
-        self.cd, self.t = cd, 0.0
+        self.cd, self.ready_at = cd, 0.0
 
-    def ready(self):
+    def ready(self, now):
         """Return True when cooldown has expired."""
-        return self.t <= 0.0
+        return now >= self.ready_at
 
-    def trigger(self):
+    def trigger(self, now):
         """Start / reset the cooldown."""
-        self.t = self.cd
+        self.ready_at = now + self.cd
 
-    def update(self, dt):
-        """Tick the timer down each frame."""
-        self.t = max(0, self.t - dt) if self.t > 0 else 0
+    def remaining(self, now):
+        """Seconds left until ready (0 when ready)."""
+        return max(0.0, self.ready_at - now)
 
 
 # ---------------------------------------------------------------------------
@@ -151,7 +281,8 @@ class Player(arcade.Sprite):
     """
     def __init__(self):
         # 1/10th of previous 0.25 scale
-        super().__init__(asset("Mattguitar(main).jpg"), scale=0.135)
+        super().__init__(texture("Mattguitar(main).jpg"), scale=0.135)
+        self.hit_r = hit_radius(self)
         self.hp_max, self.hp, self.speed = PLAYER_MAX_HP, PLAYER_MAX_HP, PLAYER_BASE_SPEED
         self.damage, self.fire_cd, self.bullet_speed, self.pierce = BASE_DAMAGE, BASE_FIRE_CD, BASE_BULLET_SPEED, 0
         self.has_spread, self.crit_chance, self.burn_on_hit = False, 0.0, False
@@ -207,7 +338,8 @@ class Enemy(arcade.Sprite):
     - Movement behavior is implemented in subclasses.
     """
     def __init__(self, texture_name: str, scale: float):
-        super().__init__(asset(texture_name), scale=0.08)
+        super().__init__(texture(texture_name), scale=0.08)
+        self.hit_r = hit_radius(self)
         self.hp = self.max_hp = 1
         self.slow_t = self.burn_t = self.burn_tick = 0.0
         self.wander_phase = random.uniform(0, math.tau)
@@ -219,10 +351,10 @@ class Enemy(arcade.Sprite):
         if slow:
             self.slow_t = max(self.slow_t, 1.2)
 
-    def update_status(self, dt, apply_burn_damage):
+    def update_status(self, dt):
         """
         Tick status timers.
-        - Burn periodically calls apply_burn_damage(1) to reduce HP.
+        - Burn periodically takes 1 HP straight off this enemy.
         """
         if self.slow_t > 0:
             self.slow_t -= dt
@@ -231,7 +363,7 @@ class Enemy(arcade.Sprite):
             self.burn_tick -= dt
             if self.burn_tick <= 0:
                 self.burn_tick = 0.5
-                apply_burn_damage(1)
+                self.hp -= 1
 
 
 class Chaser(Enemy):
@@ -245,16 +377,18 @@ class Chaser(Enemy):
         self.hp = self.max_hp = (10 if elite else 5)
         self.elite = elite
 
-    def step(self, player, dt):
-        """Chase the player with some sine-based wandering."""
+    def step(self, px, py, dt):
+        """Chase the player at (px, py) with some sine-based wandering."""
         self.wander_phase += dt
-        wx = math.cos(self.wander_phase * 2.0) * (0.5 if self.slow_t <= 0 else 0.25)
-        wy = math.sin(self.wander_phase * 1.6) * (0.4 if self.slow_t <= 0 else 0.2)
-        dx, dy = player.center_x - self.center_x, player.center_y - self.center_y
-        d = max(1.0, math.hypot(dx, dy))
-        seek = (2.6 if self.slow_t <= 0 else 1.4) * (1.2 if self.elite else 1)
-        self.center_x = snap(self.center_x + (dx / d) * seek + wx)
-        self.center_y = snap(self.center_y + (dy / d) * seek + wy)
+        slowed = self.slow_t > 0
+        wx = math.cos(self.wander_phase * 2.0) * (0.25 if slowed else 0.5)
+        wy = math.sin(self.wander_phase * 1.6) * (0.2 if slowed else 0.4)
+        x, y = self.position
+        dx, dy = px - x, py - y
+        seek = (1.4 if slowed else 2.6) * (1.2 if self.elite else 1)
+        k = seek / max(1.0, math.hypot(dx, dy))
+        # One position write = one sprite-list update instead of two
+        self.position = (snap(x + dx * k + wx), snap(y + dy * k + wy))
 
 
 class Shooter(Enemy):
@@ -264,12 +398,13 @@ class Shooter(Enemy):
         self.center_x, self.center_y, self.t = x, y, random.random() * 5
         self.hp = self.max_hp = 12
 
-    def step(self, player, dt):
+    def step(self, px, py, dt):
         """Oscillating patrol motion; aiming handled when boss/enemy fires."""
         self.t += dt
         patrol = 1.8 if self.slow_t <= 0 else 0.9
-        self.center_x = snap(self.center_x + math.sin(self.t * 1.4) * patrol)
-        self.center_y = snap(self.center_y + math.cos(self.t * 0.9) * 0.4)
+        x, y = self.position
+        self.position = (snap(x + math.sin(self.t * 1.4) * patrol),
+                         snap(y + math.cos(self.t * 0.9) * 0.4))
 
 
 class Bomber(Enemy):
@@ -280,51 +415,94 @@ class Bomber(Enemy):
         self.hp = self.max_hp = 10
         self.telegraphs, self.t = [], 0.0
 
-    def step(self, player, dt):
+    def step(self, px, py, dt):
         """Fall down plus slight horizontal wiggle; explosions handled in GameView."""
         self.t += dt
-        fall = 1.1 if self.slow_t <= 0 else 0.6
-        self.center_y = snap(self.center_y - fall)
-        self.center_x = snap(self.center_x + math.sin(self.t * 1.3) * (0.6 if self.slow_t <= 0 else 0.3))
+        slowed = self.slow_t > 0
+        x, y = self.position
+        self.position = (snap(x + math.sin(self.t * 1.3) * (0.3 if slowed else 0.6)),
+                         snap(y - (0.6 if slowed else 1.1)))
 
 
-class Bullet(arcade.SpriteCircle):
+class Bullet(arcade.Sprite):
     """
     Generic bullet.
     - owner = "player" or "enemy" (used for collision routing).
     - pierce_left controls how many extra targets it can pass through.
     """
     def __init__(self, x, y, dx, dy, speed, color, owner, radius=3, pierce_left=0):
-        super().__init__(radius, color)
+        super().__init__(CIRCLE_TEXTURE)
+        self.reset(x, y, dx, dy, speed, color, owner, radius, pierce_left)
+
+    def reset(self, x, y, dx, dy, speed, color, owner, radius=3, pierce_left=0):
+        """(Re)initialize all per-shot state; used both on creation and when pooled."""
+        self.scale = radius / CIRCLE_TEXTURE_RADIUS
+        self.color = color
         self.center_x, self.center_y = x, y
         self.change_x, self.change_y = dx * speed, dy * speed
-        self.owner, self.pierce_left = owner, pierce_left
+        self.owner, self.pierce_left, self.radius = owner, pierce_left, radius
+        self.spread_pellet = False
+
+
+class SpritePool:
+    """
+    Free-list of spent sprites of one class (bullets, XP orbs, pickups).
+    - acquire(*args) reuses a released sprite via its reset(*args) when one is available,
+      else builds cls(*args).
+    - release() takes a sprite out of its SpriteLists and keeps it for reuse.
+    """
+    def __init__(self, cls):
+        self.cls, self.free = cls, []
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            s = self.free.pop()
+            s.reset(*args, **kwargs)
+            return s
+        return self.cls(*args, **kwargs)
 
+    def release(self, s):
+        # Only recycle sprites that are still live, so a double release can't duplicate one
+        if s.sprite_lists:
+            s.remove_from_sprite_lists()
+            self.free.append(s)
 
-class XPOrb(arcade.SpriteCircle):
+
+class XPOrb(arcade.Sprite):
     """
     XP pickup.
     - Spawned from dead enemies.
     - Initially drifts, then can be pulled by magnet effect.
     """
     def __init__(self, x, y):
-        super().__init__(6, arcade.color.SPRING_BUD)
+        super().__init__(CIRCLE_TEXTURE, scale=6 / CIRCLE_TEXTURE_RADIUS)
+        self.color = arcade.color.SPRING_BUD
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        """(Re)initialize position and drift; used both on creation and when pooled."""
         self.center_x, self.center_y = x, y
-        self.vx, self.vy = random.uniform(-0.8, 0.8), random.uniform(0.6, 1.2)
+        rnd = random.random  # C call; uniform() adds a Python frame per draw
+        self.vx, self.vy = rnd() * 1.6 - 0.8, 0.6 + rnd() * 0.6
 
     def update(self, delta_time=0.0, *args, **kwargs):
         self.center_x, self.center_y = self.center_x + self.vx, self.center_y + self.vy
         self.vx, self.vy = self.vx * 0.98, self.vy * 0.98 - 0.02
 
 
-class Pickup(arcade.SpriteCircle):
+class Pickup(arcade.Sprite):
     """
     Health/shield pickup.
     - kind = "health" or "shield".
     - Slowly falls with some drag.
     """
     def __init__(self, x, y, kind):
-        super().__init__(7, arcade.color.SKY_BLUE if kind == "shield" else arcade.color.SPRING_GREEN)
+        super().__init__(CIRCLE_TEXTURE, scale=7 / CIRCLE_TEXTURE_RADIUS)
+        self.reset(x, y, kind)
+
+    def reset(self, x, y, kind):
+        """(Re)initialize kind, tint and fall speed; used both on creation and when pooled."""
+        self.color = arcade.color.SKY_BLUE if kind == "shield" else arcade.color.SPRING_GREEN
         self.center_x, self.center_y, self.kind, self.vy = x, y, kind, 1.2
 
     def update(self, delta_time=0.0, *args, **kwargs):
@@ -341,18 +519,92 @@ class Boss(arcade.Sprite):
         tex = "boss.png"
         # smaller than before
         scale = 0.25 if giant else 0.15
-        super().__init__(asset(tex), scale=scale)
+        super().__init__(texture(tex), scale=scale)
+        self.hit_r = hit_radius(self)
 
         self.center_x, self.center_y = SCREEN_WIDTH / 2, SCREEN_HEIGHT - 150
         self.max_hp = 3000 if giant else 2400
         self.hp, self.phase_timer, self.telegraphs, self.phase = self.max_hp, 0.0, [], 1
         self.giant = giant
+        # phase_timer value at which the next timed volley fires (giant / phase 2)
+        self.next_shot_at = 0.0
 
     def hp_norm(self):
         """Return HP ratio 0..1 for boss health bar."""
         return max(0.0, self.hp / self.max_hp)
 
 
+class ParticlePool:
+    """
+    Hit/explosion particles.
+    - Every particle is a plain Sprite on one shared texture, held in a single
+      SpriteList, so the whole effect layer is drawn with one call.
+    - Simulation state lives in parallel lists (vx, vy, life) indexed like the
+      SpriteList; sprites only carry what the renderer needs.
+    - Dead sprites go to a free list and are reused by emit(), so bursts
+      don't allocate once the pool has warmed up.
+    """
+    def __init__(self):
+        self.sprites = arcade.SpriteList()
+        self.vx, self.vy, self.life = [], [], []
+        self._free = []
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def clear(self):
+        self.sprites.clear()
+        self.vx.clear()
+        self.vy.clear()
+        self.life.clear()
+
+    def emit(self, x, y, count, color, vel, life=0.45, spread=6):
+        """
+        Spawn count particles within +/-spread of (x, y) with random velocity up to vel.
+        - Drops whatever would exceed MAX_PARTICLES.
+        """
+        count = min(count, MAX_PARTICLES - len(self.sprites))
+        if count <= 0:
+            return
+        # random.random() is a C call; random.uniform() adds a Python frame per draw
+        rnd, span, vspan = random.random, spread * 2, vel * 2
+        free = self._free
+        burst = []
+        for _ in range(count):
+            if free:
+                p = free.pop()
+                p.alpha = 255
+            else:
+                p = arcade.Sprite(CIRCLE_TEXTURE, scale=3 / CIRCLE_TEXTURE_RADIUS)
+            p.color = color
+            p.position = (x + rnd() * span - spread, y + rnd() * span - spread)
+            burst.append(p)
+        # Append the whole burst at once rather than growing four lists per particle
+        self.sprites.extend(burst)
+        self.vx.extend([rnd() * vspan - vel for _ in range(count)])
+        self.vy.extend([rnd() * vspan - vel for _ in range(count)])
+        self.life.extend([life] * count)
+
+    def update(self, dt):
+        """Advance particles: move, fade out, drop dead ones."""
+        sprites, vx, vy, life = self.sprites, self.vx, self.vy, self.life
+        free = self._free
+        for i in range(len(sprites) - 1, -1, -1):
+            t = life[i] - dt
+            if t <= 0:
+                free.append(sprites.pop(i))
+                del vx[i], vy[i], life[i]
+                continue
+            life[i] = t
+            p = sprites[i]
+            p.alpha = max(40, int(255 * min(1.0, t / 0.5)))
+            p.center_x = snap(p.center_x + vx[i])
+            p.center_y = snap(p.center_y + vy[i])
+
+    def draw(self):
+        self.sprites.draw()
+
+
 # ---------------------------------------------------------------------------
 # Text helpers (for UI / HUD)
 # ---------------------------------------------------------------------------
@@ -386,6 +638,14 @@ def draw_lrbt_rect_outline_center(cx, cy, w, h, color, line_width=1):
     arcade.draw_lrbt_rectangle_outline(cx - w / 2, cx + w / 2, cy - h / 2, cy + h / 2, color, line_width)
 
 
+def draw_telegraph_rings(telegraphs):
+    """Draw one owner's telegraph rings, fading the edge as each one counts down."""
+    for (x, y, r, t, kind) in telegraphs:
+        alpha = int(60 + 120 * (t / 0.9))
+        arcade.draw_circle_filled(x, y, r, DANGER_FILL)
+        arcade.draw_circle_outline(x, y, r, (*DANGER_EDGE[:3], alpha), 3)
+
+
 def draw_health_bar(x, y, width, height, hp, hp_max, edge_color=arcade.color.WHITE):
     """
     Generic health bar renderer.
@@ -423,19 +683,25 @@ class MenuView(arcade.View):
         self.controls = make_text("WASD: Move • SPACE/Click: Shoot • Z: Melee • LSHIFT: Dash", 12,
                                   arcade.color.WHITE, "center")
         self.start = make_text("Press ENTER to Start", 22, arcade.color.LIGHT_GREEN, "center")
-
-    def on_show(self):
+        # Grid line endpoints never change, so build them once and submit all lines in one draw call
+        top, right = SCREEN_HEIGHT - ARENA_MARGIN, SCREEN_WIDTH - ARENA_MARGIN
+        self.grid_points = []
+        for x in range(ARENA_MARGIN, right + 1, GRID_SPACING):
+            self.grid_points += [(x, GROUND_Y), (x, top)]
+        for y in range(GROUND_Y, top + 1, GRID_SPACING):
+            self.grid_points += [(ARENA_MARGIN, y), (right, y)]
+
+    def on_show_view(self):
         arcade.set_background_color(BG_BOTTOM)
+        # No frame budget to protect outside gameplay: let the collector see everything again
+        gc.unfreeze()
+        gc.set_threshold(*DEFAULT_GC_THRESHOLDS)
 
     def on_draw(self):
         """Render menu background and text."""
-        self.clear()
-        arcade.draw_lrbt_rectangle_filled(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, BG_BOTTOM)
+        self.clear()  # already fills with BG_BOTTOM (set in on_show_view)
         arcade.draw_lrbt_rectangle_filled(0, SCREEN_WIDTH, SCREEN_HEIGHT * 0.55, SCREEN_HEIGHT, BG_TOP)
-        for x in range(ARENA_MARGIN, SCREEN_WIDTH - ARENA_MARGIN + 1, GRID_SPACING):
-            arcade.draw_line(x, GROUND_Y, x, SCREEN_HEIGHT - ARENA_MARGIN, GRID_COLOR, 1)
-        for y in range(GROUND_Y, SCREEN_HEIGHT - ARENA_MARGIN + 1, GRID_SPACING):
-            arcade.draw_line(ARENA_MARGIN, y, SCREEN_WIDTH - ARENA_MARGIN, y, GRID_COLOR, 1)
+        arcade.draw_lines(self.grid_points, GRID_COLOR, 1)
         draw_text_shadowed(self.title, SCREEN_WIDTH / 2, SCREEN_HEIGHT * 0.68)
         draw_text_shadowed(self.subtitle, SCREEN_WIDTH / 2, SCREEN_HEIGHT * 0.60)
         draw_text_shadowed(self.controls, SCREEN_WIDTH / 2, SCREEN_HEIGHT * 0.54)
@@ -461,23 +727,25 @@ class PerkDraftView(arcade.View):
         self.game, self.options, self.selected = game, options, 0
         self.title = make_text("Choose a Perk", 28, arcade.color.GOLD, "center")
         self.hint = make_text("↑/↓ to select • ENTER to confirm", 12, arcade.color.WHITE, "center")
+        # One (name, desc) text pair per option, built once; only the name color changes
+        self.option_texts = [(make_text(p.name, 18, arcade.color.LIGHT_GRAY),
+                              make_text(p.desc, 12, arcade.color.WHITE)) for p in options]
 
-    def on_show(self):
+    def on_show_view(self):
         arcade.set_background_color(BG_BOTTOM)
 
     def on_draw(self):
         """Draw perk list with highlight on currently selected option."""
-        self.clear()
-        arcade.draw_lrbt_rectangle_filled(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, BG_BOTTOM)
+        self.clear()  # already fills with BG_BOTTOM (set in on_show_view)
         arcade.draw_lrbt_rectangle_filled(0, SCREEN_WIDTH, SCREEN_HEIGHT * 0.55, SCREEN_HEIGHT, BG_TOP)
         draw_text_shadowed(self.title, SCREEN_WIDTH / 2, SCREEN_HEIGHT * 0.72)
-        for i, perk in enumerate(self.options):
+        for i, (name, desc) in enumerate(self.option_texts):
             y = SCREEN_HEIGHT * 0.52 - i * 84
-            col = arcade.color.LIGHT_GREEN if i == self.selected else arcade.color.LIGHT_GRAY
+            name._orig_color = arcade.color.LIGHT_GREEN if i == self.selected else arcade.color.LIGHT_GRAY
             arcade.draw_lrbt_rectangle_filled(SCREEN_WIDTH / 2 - 340, SCREEN_WIDTH / 2 + 340,
                                               y - 32, y + 32, (0, 0, 0, 140))
-            draw_text_shadowed(make_text(perk.name, 18, col), SCREEN_WIDTH / 2 - 320, y + 12)
-            draw_text_shadowed(make_text(perk.desc, 12, arcade.color.WHITE), SCREEN_WIDTH / 2 - 320, y - 12)
+            draw_text_shadowed(name, SCREEN_WIDTH / 2 - 320, y + 12)
+            draw_text_shadowed(desc, SCREEN_WIDTH / 2 - 320, y - 12)
         draw_text_shadowed(self.hint, SCREEN_WIDTH / 2, SCREEN_HEIGHT * 0.20)
 
     def on_key_press(self, key, modifiers):
@@ -502,22 +770,25 @@ class GameOverView(arcade.View):
         self.score, self.win, self.seconds, self.game_level = score, win, seconds, game_level
         self.title = make_text("VICTORY!" if self.win else "DEFEAT", 40,
                                arcade.color.LIGHT_GREEN if self.win else arcade.color.SALMON, "center")
+        self.summary = make_text(f"Level {game_level} • Score: {score}", 18, arcade.color.WHITE, "center")
+        self.time_text = make_text(f"Time: {int(seconds)}s", 16, arcade.color.WHITE, "center")
         self.hint = make_text("R: Replay • M: Menu • ESC: Quit", 16, arcade.color.LIGHT_GRAY, "center")
+        # Nothing on this screen moves, so resolve every label's position up front
+        cx = SCREEN_WIDTH / 2
+        self.labels = ((self.title, cx, SCREEN_HEIGHT * 0.64), (self.summary, cx, SCREEN_HEIGHT * 0.54),
+                       (self.time_text, cx, SCREEN_HEIGHT * 0.48), (self.hint, cx, SCREEN_HEIGHT * 0.34))
 
-    def on_show(self):
+    def on_show_view(self):
         arcade.set_background_color(BG_BOTTOM)
+        # No frame budget to protect outside gameplay: let the collector see everything again
+        gc.unfreeze()
+        gc.set_threshold(*DEFAULT_GC_THRESHOLDS)
 
     def on_draw(self):
         """Render simple summary of the run."""
-        self.clear()
-        arcade.draw_lrbt_rectangle_filled(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, BG_BOTTOM)
-        draw_text_shadowed(self.title, SCREEN_WIDTH / 2, SCREEN_HEIGHT * 0.64)
-        draw_text_shadowed(
-            make_text(f"Level {self.game_level} • Score: {self.score}", 18, arcade.color.WHITE, "center"),
-            SCREEN_WIDTH / 2, SCREEN_HEIGHT * 0.54)
-        draw_text_shadowed(make_text(f"Time: {int(self.seconds)}s", 16, arcade.color.WHITE, "center"),
-                           SCREEN_WIDTH / 2, SCREEN_HEIGHT * 0.48)
-        draw_text_shadowed(self.hint, SCREEN_WIDTH / 2, SCREEN_HEIGHT * 0.34)
+        self.clear()  # already fills with BG_BOTTOM (set in on_show_view)
+        for text, x, y in self.labels:
+            draw_text_shadowed(text, x, y)
 
     def on_key_press(self, key, modifiers):
         """Handle restart, menu, or quit from game over screen."""
@@ -559,11 +830,20 @@ class GameView(arcade.View):
         self.player_list = arcade.SpriteList()
         self.enemy_list = arcade.SpriteList()
         self.boss_list = arcade.SpriteList()
-        self.bullets = arcade.SpriteList()
-        self.enemy_bullets = arcade.SpriteList()
+        # Bombers also live here so per-frame telegraph passes skip type checks;
+        # remove_from_sprite_lists() on death drops them from both lists
+        self.bombers = arcade.SpriteList()
+        self.boss = None  # the live boss (at most one), or None
+        # Bullet lists are queried against every frame, so back them with a spatial hash
+        self.bullets = arcade.SpriteList(use_spatial_hash=True, spatial_hash_cell_size=32)
+        self.enemy_bullets = arcade.SpriteList(use_spatial_hash=True, spatial_hash_cell_size=32)
+        self.bullet_pool = SpritePool(Bullet)
+        self.orb_pool = SpritePool(XPOrb)
+        self.pickup_pool = SpritePool(Pickup)
+        self._hits = []  # reused result buffer for bullet_hits()
         self.xp_orbs = arcade.SpriteList()
         self.pickups = arcade.SpriteList()
-        self.particles = arcade.SpriteList()
+        self.particles = ParticlePool()
 
         # Input state flags for WASD
         self.up = self.down = self.left = self.right = 0
@@ -573,10 +853,13 @@ class GameView(arcade.View):
         self.fire_timer = Timer(BASE_FIRE_CD)
         self.dash_timer = Timer(PLAYER_DASH_CD)
         self.melee_timer = Timer(MELEE_CD)
+        self.clock = 0.0  # game time the cooldown timers run on; only advances in unpaused on_update
+        self.gc_sweep_pending = False  # set by setup(); on_update runs the GC sweep + freeze
 
         # Wave / progression state
         self.wave = 1
         self.wave_clear_bonus_pending = False
+        self.next_wave_t = 0.0  # countdown to the next wave once one is cleared (0 = none pending)
         self.xp = self.level = self.score = 0
         self.paused = False
         self.start_time = self.end_time = 0.0
@@ -589,7 +872,30 @@ class GameView(arcade.View):
         self.hud_wave = make_text("", 14, UI_COLOR)
         self.hud_score = make_text("", 14, UI_COLOR)
         self.hud_dash = make_text("", 12, arcade.color.LIGHT_GRAY)
+        # Values last written into the HUD labels; strings are only rebuilt when these change
+        self.hud_state, self.hud_dash_left = None, None
         self.hud_boss = make_text("BOSS", 12, arcade.color.WHITE, "center")
+        self.intro_title = make_text("", 30, arcade.color.WHITE, "center")
+        self.pause_title = make_text("PAUSED", 28, arcade.color.GOLD, "center")
+        self.pause_hint = make_text("ESC: resume • R: restart • M: menu", 14, arcade.color.LIGHT_GRAY, "center")
+
+        # Cached HUD/overlay rectangles: solid-color sprites whose size, color and
+        # visibility are updated per frame instead of re-drawing immediate-mode rects.
+        self.boss_bar_fill = arcade.SpriteSolidColor(BOSS_BAR_W, 20, color=arcade.color.RED)
+        self.hud_list = arcade.SpriteList()
+        self.hud_list.append(self.boss_bar_fill)
+        self.fade_overlay = arcade.SpriteSolidColor(SCREEN_WIDTH, SCREEN_HEIGHT,
+                                                    SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+        self.flash_overlay = arcade.SpriteSolidColor(SCREEN_WIDTH, SCREEN_HEIGHT,
+                                                     SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+        self.pause_panel = arcade.SpriteSolidColor(560, 180, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, (0, 0, 0, 200))
+        self.overlay_list = arcade.SpriteList()
+        self.overlay_list.extend([self.fade_overlay, self.flash_overlay, self.pause_panel])
+
+    def on_show_view(self):
+        # Perks only change cooldowns in PerkDraftView, which comes back through here
+        self.fire_timer.cd = self.player.fire_cd
+        self.dash_timer.cd = self.player.dash_cd
 
     def setup(self):
         """
@@ -617,14 +923,16 @@ class GameView(arcade.View):
         self.bg_sprite.width = SCREEN_WIDTH
         self.bg_sprite.height = SCREEN_HEIGHT
 
-        self.bg_list = arcade.SpriteList()
+        # Reuse the list built in __init__ rather than allocating a new one per setup()
+        self.bg_list.clear()
         self.bg_list.append(self.bg_sprite)
         # ---------------------------------------------------------
 
         # Clear all sprite lists for a fresh level
-        for lst in [self.player_list, self.enemy_list, self.boss_list, self.bullets,
+        for lst in [self.player_list, self.enemy_list, self.bombers, self.boss_list, self.bullets,
                     self.enemy_bullets, self.xp_orbs, self.pickups, self.particles]:
             lst.clear()
+        self.boss = None
 
         # --------------------------------------------------
         # Persistent player — do NOT reset perks between levels/waves
@@ -653,11 +961,16 @@ class GameView(arcade.View):
         # Reset run-level state
         self.wave, self.wave_clear_bonus_pending, self.xp, self.level = 1, False, 0, 1
         self.score, self.paused, self.intro_t = 0, False, 0.9
-        self.start_time, self.shake_t, self.flash_t = time.time(), 0.0, 0.0
+        self.start_time, self.shake_t, self.flash_t, self.next_wave_t = time.time(), 0.0, 0.0, 0.0
+        self.clock = 0.0
 
         # Spawn initial wave or boss depending on level
         self._spawn_wave(self.wave)
 
+        # Sweep + freeze on the first tick instead of here: the view that built this one is
+        # still current (and on the call stack) until show_view() swaps it out
+        self.gc_sweep_pending = True
+
     def _spawn_wave(self, w):
         """
         Spawn a wave of enemies or boss based on:
@@ -669,7 +982,8 @@ class GameView(arcade.View):
 
         if self.game_level == 3:
             # Level 3 always spawns the giant boss
-            self.boss_list.append(Boss(giant=True))
+            self.boss = Boss(giant=True)
+            self.boss_list.append(self.boss)
         elif w < TOTAL_WAVES:
             # Regular waves (Level 1/2)
             mult = 1.5 if self.game_level == 2 else 1.0
@@ -678,12 +992,15 @@ class GameView(arcade.View):
             for _ in range(int((2 + w // 2) * mult)):
                 self.enemy_list.append(Shooter(rngx(), rngy()))
             for _ in range(int((1 + w // 2) * mult)):
-                self.enemy_list.append(Bomber(rngx(), rngy()))
+                bomber = Bomber(rngx(), rngy())
+                self.enemy_list.append(bomber)
+                self.bombers.append(bomber)
             if random.random() < 0.3:
                 self.enemy_list.append(Chaser(rngx(), rngy(), elite=True))
         else:
             # After last wave, spawn non-giant boss
-            self.boss_list.append(Boss(giant=False))
+            self.boss = Boss(giant=False)
+            self.boss_list.append(self.boss)
 
     def _draw_background(self):
         """
@@ -702,14 +1019,12 @@ class GameView(arcade.View):
     def _draw_telegraphs(self):
         """
         Draw telegraphed danger zones (rings) for Bombers and Boss.
-        - Uses the telegraphs list on each enemy/boss.
+        - Uses the telegraphs list on each bomber/boss.
         """
-        for e in list(self.enemy_list) + list(self.boss_list):
-            if hasattr(e, 'telegraphs'):
-                for (x, y, r, t, kind) in e.telegraphs:
-                    alpha = int(60 + 120 * (t / 0.9))
-                    arcade.draw_circle_filled(x, y, r, DANGER_FILL)
-                    arcade.draw_circle_outline(x, y, r, (*DANGER_EDGE[:3], alpha), 3)
+        for e in self.bombers:
+            draw_telegraph_rings(e.telegraphs)
+        if self.boss is not None:
+            draw_telegraph_rings(self.boss.telegraphs)
 
     def _draw_outlines(self):
         """
@@ -719,7 +1034,8 @@ class GameView(arcade.View):
         arcade.draw_circle_outline(self.player.center_x, self.player.center_y, pr, PLAYER_OUT, 2)
         for e in self.enemy_list:
             arcade.draw_circle_outline(e.center_x, e.center_y, e.width / 2 + 2, ENEMY_OUT, 2)
-        for b in self.boss_list:
+        b = self.boss
+        if b is not None:
             arcade.draw_circle_outline(b.center_x, b.center_y, b.width / 2 + 3, BOSS_OUT, 3)
 
     def _draw_health_bars(self):
@@ -741,13 +1057,15 @@ class GameView(arcade.View):
             draw_health_bar(e.center_x, e.center_y + e.height / 2 + 10, 46, 6, e.hp, e.max_hp)
 
         # Boss bar
-        if len(self.boss_list):
-            b = self.boss_list[0]
-            bw, bx, by = 460, SCREEN_WIDTH - 20 - 460, SCREEN_HEIGHT - 42
+        b = self.boss
+        if b is not None:
+            bw, bx, by = BOSS_BAR_W, SCREEN_WIDTH - 20 - BOSS_BAR_W, SCREEN_HEIGHT - 42
             arcade.draw_lrbt_rectangle_outline(bx - 2, bx + bw + 2, by - 12, by + 12, arcade.color.WHITE, 2)
             fill_w = int(bw * b.hp_norm())
             if fill_w > 0:
-                arcade.draw_lrbt_rectangle_filled(bx, bx + fill_w, by - 10, by + 10, arcade.color.RED)
+                self.boss_bar_fill.width = fill_w
+                self.boss_bar_fill.left, self.boss_bar_fill.center_y = bx, by
+                self.hud_list.draw()
             self.hud_boss.position = (bx + bw / 2, by - 10)
             draw_text_shadowed(self.hud_boss, *self.hud_boss.position)
 
@@ -771,23 +1089,13 @@ class GameView(arcade.View):
         self.player_list.draw()
         self._draw_outlines()
         self.enemy_list.draw()
-        self.boss_list.draw()
+        if self.boss is not None:
+            self.boss_list.draw()
         self.bullets.draw()
         self.enemy_bullets.draw()
         self.xp_orbs.draw()
         self.pickups.draw()
 
-        # Particles
-        for p in list(self.particles):
-            life = getattr(p, "life", 0.0)
-            if life <= 0:
-                p.remove_from_sprite_lists()
-            else:
-                alpha = int(255 * min(1.0, life / 0.5))
-                p.color = (p.color[0], p.color[1], p.color[2], max(40, min(255, alpha)))
-                p.center_x = snap(p.center_x + getattr(p, "change_x", 0.0))
-                p.center_y = snap(p.center_y + getattr(p, "change_y", 0.0))
-                p.life = life - 1 / 60
         self.particles.draw()
 
         # 3. Draw ARENA BORDER LAST (so it doesn't get covered)
@@ -797,29 +1105,30 @@ class GameView(arcade.View):
         self._draw_health_bars()
         self._draw_hud()
 
-        # 5. Intro fade/title
+        # 5. Overlays: intro fade, damage flash, pause panel (one cached SpriteList)
+        self.fade_overlay.visible = self.intro_t > 0
+        if self.fade_overlay.visible:
+            self.fade_overlay.color = (0, 0, 0, int(min(self.intro_t * 400, 220)))
+        self.flash_overlay.visible = self.flash_t > 0
+        if self.flash_overlay.visible:
+            self.flash_overlay.color = (255, 40, 40, int(150 * min(1.0, self.flash_t / 0.15)))
+        self.pause_panel.visible = self.paused
+        self.overlay_list.draw()
+
+        # Intro title
         if self.intro_t > 0:
-            a = int(min(self.intro_t * 400, 220))
-            arcade.draw_lrbt_rectangle_filled(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, (0, 0, 0, a))
             if self.game_level == 3:
                 title_txt = "Level 3 - Giant Boss"
             else:
                 title_txt = f"Level {self.game_level} - Wave {self.wave}"
-            title = make_text(title_txt, 30, arcade.color.WHITE, "center")
-            draw_text_shadowed(title, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 8)
+            self.intro_title.text = title_txt
+            draw_text_shadowed(self.intro_title, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 8)
 
-        # Damage flash
-        if self.flash_t > 0:
-            alpha = int(150 * min(1.0, self.flash_t / 0.15))
-            arcade.draw_lrbt_rectangle_filled(0, SCREEN_WIDTH, 0, SCREEN_HEIGHT, (255, 40, 40, alpha))
-
-        # Pause screen
+        # Pause text
         if self.paused:
-            cx, cy, w, h = SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, 560, 180
-            arcade.draw_lrbt_rectangle_filled(cx - w / 2, cx + w / 2, cy - h / 2, cy + h / 2, (0, 0, 0, 200))
-            draw_text_shadowed(make_text("PAUSED", 28, arcade.color.GOLD, "center"), cx, cy + 26)
-            draw_text_shadowed(make_text("ESC: resume • R: restart • M: menu", 14, arcade.color.LIGHT_GRAY, "center"),
-                               cx, cy - 12)
+            cx, cy = SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2
+            draw_text_shadowed(self.pause_title, cx, cy + 26)
+            draw_text_shadowed(self.pause_hint, cx, cy - 12)
 
     def _draw_hud(self):
         """
@@ -827,13 +1136,20 @@ class GameView(arcade.View):
         - HP, level, wave, score, dash cooldown
         - XP bar for next level
         """
-        self.hud_hp.text = f"HP {self.player.hp}/{self.player.hp_max}"
-        self.hud_lv.text = f"LV {self.level}"
-        self.hud_level.text = f"GAME LV {self.game_level}"
-        self.hud_wave.text = f"Wave {self.wave}/{TOTAL_WAVES}"
-        self.hud_score.text = f"Score {self.score}"
-        dash_msg = "Ready" if self.dash_timer.ready() else f"{self.dash_timer.t:.1f}s"
-        self.hud_dash.text = f"Dash: {dash_msg}"
+        state = (self.player.hp, self.player.hp_max, self.level, self.game_level, self.wave, self.score)
+        if state != self.hud_state:
+            self.hud_state = state
+            self.hud_hp.text = f"HP {self.player.hp}/{self.player.hp_max}"
+            self.hud_lv.text = f"LV {self.level}"
+            self.hud_level.text = f"GAME LV {self.game_level}"
+            self.hud_wave.text = f"Wave {self.wave}/{TOTAL_WAVES}"
+            self.hud_score.text = f"Score {self.score}"
+        # Dash label only changes at the 0.1s resolution it displays (-1 = ready)
+        dash, now = self.dash_timer, self.clock
+        dash_left = -1.0 if dash.ready(now) else round(dash.remaining(now), 1)
+        if dash_left != self.hud_dash_left:
+            self.hud_dash_left = dash_left
+            self.hud_dash.text = "Dash: Ready" if dash_left < 0 else f"Dash: {dash_left:.1f}s"
 
         self.hud_hp.position = (12, SCREEN_HEIGHT - 26)
         self.hud_lv.position = (12, SCREEN_HEIGHT - 48)
@@ -867,140 +1183,117 @@ class GameView(arcade.View):
         - Updates timers, player movement, enemies, boss AI.
         - Manages collisions, XP, pickups, and win/lose conditions.
         """
+        if self.gc_sweep_pending:
+            # The previous view is gone by now, so collect it, then freeze the survivors so
+            # the collector never rescans this level's long-lived sprites, pools and text
+            self.gc_sweep_pending = False
+            gc.unfreeze()
+            gc.collect()
+            gc.freeze()
+            gc.set_threshold(*GAMEPLAY_GC_THRESHOLDS)
         if self.paused:
             return
         if self.intro_t > 0:
             self.intro_t -= dt
+            # Let bursts already in flight (e.g. the last kill of a wave) play out under the intro card
+            self.particles.update(dt)
             return
 
         # Level progression condition:
         # Reach score >= 90, finish waves/boss, then advance (for level < 3).
         if self.score >= 90 and self.game_level < 3:
-            if not len(self.enemy_list) and not len(self.boss_list) and not self.wave_clear_bonus_pending:
+            if not len(self.enemy_list) and self.boss is None and not self.wave_clear_bonus_pending:
                 self._advance_level()
                 return
 
-        # Sync timers with current player stats (modified by perks)
-        self.fire_timer.cd = self.player.fire_cd
-        self.dash_timer.cd = self.player.dash_cd
-        self.fire_timer.update(dt)
-        self.dash_timer.update(dt)
-        self.melee_timer.update(dt)
+        self.clock += dt
         self.player.update_timers(dt)
 
         if self.shake_t > 0:
             self.shake_t -= dt
         if self.flash_t > 0:
             self.flash_t -= dt
+        if self.next_wave_t > 0:
+            self.next_wave_t -= dt
+            if self.next_wave_t <= 0:
+                self._start_next_wave()
 
         # Auto-fire when holding shoot
-        if self.shoot_hold and self.fire_timer.ready():
+        if self.shoot_hold and self.fire_timer.ready(self.clock):
             self._player_shoot()
 
-        # Player movement (WASD)
-        dx = (self.right - self.left)
-        dy = (self.up - self.down)
-        speed = self.player.speed
-        # Normalize diagonal speed
-        if dx and dy:
-            speed *= 0.7071
-        if self.player.dashing > 0:
-            speed = self.player.dash_speed
-        self.player.center_x = snap(self.player.center_x + dx * speed)
-        self.player.center_y = snap(self.player.center_y + dy * speed)
-
-        # Keep player inside arena
-        if self.player.left < ARENA_MARGIN:
-            self.player.left = ARENA_MARGIN
-        if self.player.right > SCREEN_WIDTH - ARENA_MARGIN:
-            self.player.right = SCREEN_WIDTH - ARENA_MARGIN
-        if self.player.bottom < GROUND_Y:
-            self.player.bottom = GROUND_Y
-        if self.player.top > SCREEN_HEIGHT - ARENA_MARGIN:
-            self.player.top = SCREEN_HEIGHT - ARENA_MARGIN
+        # Player movement (WASD); diagonal normalization is baked into MOVE_TABLE
+        dx, dy, scale = MOVE_TABLE[(self.up, self.down, self.left, self.right)]
+        speed = self.player.dash_speed if self.player.dashing > 0 else self.player.speed * scale
+        # Move and keep player inside arena with a single position write
+        x, y = self.player.position
+        self.player.position = arena_clamp(self.player, snap(x + dx * speed), snap(y + dy * speed))
 
         # Update projectiles and pickups
-        self.bullets.update()
-        self.enemy_bullets.update()
+        self._step_bullets()
         self.xp_orbs.update()
         self.pickups.update()
+        self.particles.update(dt)
 
         # XP magnet behavior
+        # Compare squared distances; only orbs inside the radius pay for a sqrt
+        px, py = self.player.center_x, self.player.center_y
+        magnet_r2 = self.player.magnet_radius ** 2
         for orb in self.xp_orbs:
-            d = dist(self.player.center_x, self.player.center_y, orb.center_x, orb.center_y)
-            if d < self.player.magnet_radius:
-                vx, vy = (self.player.center_x - orb.center_x) / (d or 1), (
-                        self.player.center_y - orb.center_y) / (d or 1)
-                orb.center_x = snap(orb.center_x + vx * 4.2)
-                orb.center_y = snap(orb.center_y + vy * 4.2)
+            dx, dy = px - orb.center_x, py - orb.center_y
+            d2 = dx * dx + dy * dy
+            if d2 < magnet_r2:
+                k = 4.2 / math.sqrt(d2) if d2 else 0.0
+                orb.center_x = snap(orb.center_x + dx * k)
+                orb.center_y = snap(orb.center_y + dy * k)
 
         # Enemy AI updates + status ticks
-        for e in list(self.enemy_list):
-            e.update_status(dt, lambda dmg, _e=e: setattr(_e, "hp", _e.hp - dmg))
-            if isinstance(e, (Chaser, Shooter, Bomber)):
-                e.step(self.player, dt)
+        # Walk backwards by index: _enemy_die() only removes e, so no copy of the list is needed
+        enemies = self.enemy_list
+        for i in range(len(enemies) - 1, -1, -1):
+            e = enemies[i]
+            e.update_status(dt)
+            e.step(px, py, dt)
             # Keep enemies in arena
-            if e.left < ARENA_MARGIN:
-                e.left = ARENA_MARGIN
-            if e.right > SCREEN_WIDTH - ARENA_MARGIN:
-                e.right = SCREEN_WIDTH - ARENA_MARGIN
-            if e.bottom < GROUND_Y:
-                e.bottom = GROUND_Y
-            if e.top > SCREEN_HEIGHT - ARENA_MARGIN:
-                e.top = SCREEN_HEIGHT - ARENA_MARGIN
+            e.position = arena_clamp(e, *e.position)
             # Handle death
             if e.hp <= 0:
                 self._enemy_die(e)
 
         # Bomber attack telegraphs & ring shots
-        for e in self.enemy_list:
-            if isinstance(e, Bomber):
-                # Randomly create telegraphed rings
-                if random.random() < (0.006 if e.slow_t <= 0 else 0.003):
-                    e.telegraphs.append((e.center_x, e.center_y - 4, 36, 0.9, "RING"))
-                nt = []
-                for (x, y, r, t, k) in e.telegraphs:
-                    t -= dt
-                    if t <= 0:
-                        self._spawn_ring_bullets(x, y, r, count=16, speed=6.2)
-                        self.shake_t = 0.12
-                    else:
-                        nt.append((x, y, r, t, k))
-                e.telegraphs = nt
+        for e in self.bombers:
+            # Randomly create telegraphed rings
+            if random.random() < (0.006 if e.slow_t <= 0 else 0.003):
+                e.telegraphs.append([e.center_x, e.center_y - 4, 36, 0.9, "RING"])
+            tgs = e.telegraphs
+            for i in range(len(tgs) - 1, -1, -1):
+                tg = tgs[i]
+                tg[3] -= dt
+                if tg[3] <= 0:
+                    self._spawn_ring_bullets(tg[0], tg[1], tg[2], count=16, speed=6.2)
+                    self.shake_t = 0.12
+                    del tgs[i]
 
         # Boss AI
-        if len(self.boss_list):
+        if self.boss is not None:
             self._boss_logic(dt)
-            b = self.boss_list[0]
+            b = self.boss
             # Keep boss in arena
-            if b.left < ARENA_MARGIN:
-                b.left = ARENA_MARGIN
-            if b.right > SCREEN_WIDTH - ARENA_MARGIN:
-                b.right = SCREEN_WIDTH - ARENA_MARGIN
-            if b.bottom < GROUND_Y:
-                b.bottom = GROUND_Y
-            if b.top > SCREEN_HEIGHT - ARENA_MARGIN:
-                b.top = SCREEN_HEIGHT - ARENA_MARGIN
+            b.position = arena_clamp(b, *b.position)
 
         # Resolves all collision types (bullets vs enemies, player vs bullets, pickups, etc.)
         self._handle_collisions()
 
-        # Remove bullets that leave arena
-        for b in list(self.bullets) + list(self.enemy_bullets):
-            if (b.right < ARENA_MARGIN or b.left > SCREEN_WIDTH - ARENA_MARGIN or
-                    b.top > SCREEN_HEIGHT - ARENA_MARGIN or b.bottom < GROUND_Y):
-                b.remove_from_sprite_lists()
-
         # Wave clear -> spawn bonus XP and schedule next wave
         if self.wave < TOTAL_WAVES and not len(self.enemy_list) and not self.wave_clear_bonus_pending:
             self.wave_clear_bonus_pending = True
+            px, py, rnd = self.player.center_x, self.player.center_y, random.random
             for _ in range(XP_PER_WAVE_CLEAR):
-                self.xp_orbs.append(XPOrb(self.player.center_x + random.uniform(-20, 20),
-                                          self.player.center_y + random.uniform(-10, 10)))
-            arcade.schedule(self._start_next_wave, 1.2)
+                self.xp_orbs.append(self.orb_pool.acquire(px + rnd() * 40 - 20, py + rnd() * 20 - 10))
+            self.next_wave_t = 1.2
 
         # After final wave and boss:
-        if self.wave == TOTAL_WAVES and not len(self.boss_list) and not self.wave_clear_bonus_pending:
+        if self.wave == TOTAL_WAVES and self.boss is None and not self.wave_clear_bonus_pending:
             if self.game_level < 3 and self.score >= 90:
                 self._advance_level()
             elif self.game_level == 3:
@@ -1011,28 +1304,30 @@ class GameView(arcade.View):
         Controls boss movement and attack patterns.
         - Different behavior for giant vs non-giant boss and phases.
         """
-        b = self.boss_list[0]
+        b = self.boss
         b.phase_timer += dt
+        sin, cos = math.sin, math.cos
 
         # Phase switch at 50% HP for non-giant boss
         if b.phase == 1 and b.hp < b.max_hp * 0.5:
             b.phase = 2
-            b.phase_timer = 0.0
+            b.phase_timer = b.next_shot_at = 0.0
 
         # Horizontal oscillation
-        b.center_x = snap(b.center_x + math.sin(b.phase_timer * 0.9) * (1.6 if b.phase == 2 else 1.2))
+        b.center_x = snap(b.center_x + sin(b.phase_timer * 0.9) * (1.6 if b.phase == 2 else 1.2))
 
         if b.giant:
             # Giant boss (Level 3) attack pattern
-            if int(b.phase_timer * 10) % 8 == 0 and b.phase_timer % 0.1 < dt:
-                angle = random.uniform(0, math.tau)
+            if b.phase_timer >= b.next_shot_at:
+                b.next_shot_at += 0.8
+                angle = random.random() * math.tau
                 self.enemy_bullets.append(
-                    Bullet(b.center_x, b.center_y, math.cos(angle), math.sin(angle),
-                           7.5, arcade.color.LIGHT_CORAL, "enemy"))
+                    self.bullet_pool.acquire(b.center_x, b.center_y, cos(angle), sin(angle),
+                                             7.5, BOSS_SHOT_COLOR, "enemy"))
             if random.random() < 0.015:
-                b.telegraphs.append((b.center_x + random.uniform(-40, 40),
-                                     b.center_y - 8 + random.uniform(-20, 20),
-                                     random.choice((42, 52, 62)), 0.9, "RING_BIG"))
+                b.telegraphs.append([b.center_x + random.random() * 80 - 40,
+                                     b.center_y - 8 + random.random() * 40 - 20,
+                                     (42, 52, 62)[int(random.random() * 3)], 0.9, "RING_BIG"])
         else:
             # Normal boss (Levels 1–2)
             if b.phase == 1:
@@ -1042,43 +1337,68 @@ class GameView(arcade.View):
                     dx, dy = self.player.center_x - b.center_x, self.player.center_y - b.center_y
                     d = math.hypot(dx, dy) or 1
                     self.enemy_bullets.append(
-                        Bullet(b.center_x, b.center_y, dx / d, dy / d, 7.2, arcade.color.PURPLE, "enemy"))
+                        self.bullet_pool.acquire(b.center_x, b.center_y, dx / d, dy / d,
+                                                 7.2, BOSS_AIMED_COLOR, "enemy"))
                     if random.random() < 0.35:
-                        b.telegraphs.append((b.center_x, b.center_y - 6, 40, 0.9, "RING"))
+                        b.telegraphs.append([b.center_x, b.center_y - 6, 40, 0.9, "RING"])
             else:
                 # Phase 2: fan spreads + more dangerous rings
-                if int(b.phase_timer * 10) % 16 == 0 and b.phase_timer % 0.1 < dt:
-                    dx, dy = self.player.center_x - b.center_x, self.player.center_y - b.center_y
-                    base = math.atan2(dy, dx)
-                    spread = math.radians(90)
-                    for i in range(9):
-                        ang = base + spread * (i / 8 - 0.5)
+                if b.phase_timer >= b.next_shot_at:
+                    b.next_shot_at += 1.6
+                    bx, by = b.center_x, b.center_y
+                    dx, dy = self.player.center_x - bx, self.player.center_y - by
+                    d = math.hypot(dx, dy) or 1
+                    ux, uy = dx / d, dy / d
+                    # Rotate the cached fan offsets onto the aim direction
+                    for fc, fs in fan_offsets(9, BOSS_FAN_SPREAD):
                         self.enemy_bullets.append(
-                            Bullet(b.center_x, b.center_y, math.cos(ang), math.sin(ang),
-                                   7.8, arcade.color.LIGHT_CORAL, "enemy"))
+                            self.bullet_pool.acquire(bx, by, ux * fc - uy * fs, ux * fs + uy * fc,
+                                                     7.8, BOSS_SHOT_COLOR, "enemy"))
                 if random.random() < 0.018:
-                    b.telegraphs.append((b.center_x, b.center_y - 8,
-                                         random.choice((42, 52)), 0.9, "RING_BIG"))
+                    b.telegraphs.append([b.center_x, b.center_y - 8,
+                                         42 if random.random() < 0.5 else 52, 0.9, "RING_BIG"])
 
         # Resolve telegraphs -> spawn ring bullets
-        nt = []
-        for (x, y, r, t, k) in b.telegraphs:
-            t -= dt
-            if t <= 0:
-                self._spawn_ring_bullets(x, y, r, count=12 if k == "RING" else 18, speed=5.0)
+        # Entries are mutable [x, y, r, time_left, kind] lists, ticked and dropped in place
+        tgs = b.telegraphs
+        for i in range(len(tgs) - 1, -1, -1):
+            tg = tgs[i]
+            tg[3] -= dt
+            if tg[3] <= 0:
+                self._spawn_ring_bullets(tg[0], tg[1], tg[2],
+                                         count=12 if tg[4] == "RING" else 18, speed=5.0)
                 self.shake_t = 0.18
-            else:
-                nt.append((x, y, r, t, k))
-        b.telegraphs = nt
+                del tgs[i]
 
     def _spawn_ring_bullets(self, x, y, r, count=18, speed=6.6):
         """
         Spawn a ring of enemy bullets around (x,y).
         - Used by Bombers and Boss telegraphs.
         """
-        for i in range(count):
-            a = 2 * math.pi * i / count
-            self.enemy_bullets.append(Bullet(x, y, math.cos(a), math.sin(a), speed, BULLET_COLOR_ENEMY, "enemy"))
+        acquire, append = self.bullet_pool.acquire, self.enemy_bullets.append
+        for dx, dy in ring_dirs(count):
+            append(acquire(x, y, dx, dy, speed, BULLET_COLOR_ENEMY, "enemy"))
+
+    def _step_bullets(self):
+        """
+        Move every bullet and drop the ones that have left the arena.
+        - One fused pass per list instead of SpriteList.update() plus a separate cull loop.
+        - Walks each list backwards so releasing the current bullet is safe.
+        """
+        x_min, x_max = ARENA_MARGIN, SCREEN_WIDTH - ARENA_MARGIN
+        y_min, y_max = GROUND_Y, SCREEN_HEIGHT - ARENA_MARGIN
+        release = self.bullet_pool.release
+        for lst in (self.bullets, self.enemy_bullets):
+            for i in range(len(lst) - 1, -1, -1):
+                b = lst[i]
+                x, y = b.position
+                x += b.change_x
+                y += b.change_y
+                r = b.radius
+                if x + r < x_min or x - r > x_max or y + r > y_max or y - r < y_min:
+                    release(b)
+                else:
+                    b.position = (x, y)
 
     def _handle_collisions(self):
         """
@@ -1091,136 +1411,161 @@ class GameView(arcade.View):
         # ---------------------------
         # Player bullets vs enemies
         # ---------------------------
-        for e in list(self.enemy_list):
-            hits = arcade.check_for_collision_with_list(e, self.bullets)
-            if hits:
-                for proj in hits:
-                    # Pierce handling
-                    if proj.pierce_left > 0:
-                        proj.pierce_left -= 1
-                    else:
-                        proj.remove_from_sprite_lists()
-                # Check if bullet is a spread pellet
-                is_spread = hasattr(proj, "spread_pellet")
-
-                NERF_MULT = 0.6  # 60% damage for spread pellets
-                base = self.player.damage * (NERF_MULT if is_spread else 1.0)
-                dmg_per = base * (2 if random.random() < self.player.crit_chance else 1)
-                e.hp -= dmg_per * len(hits)
-                e.apply_status(self.player.burn_on_hit, self.player.slow_on_hit)
-                self._hit_particles(e.center_x, e.center_y, color=arcade.color.GOLD)
-                if e.hp <= 0:
-                    self._enemy_die(e)
+        # Bind what every pass touches once; the player and pools don't change mid-call
+        player, bullets, release = self.player, self.bullets, self.bullet_pool.release
+        enemies = self.enemy_list
+        # Skip the whole pass when nothing is in flight (common between volleys)
+        if len(bullets):
+            for i in range(len(enemies) - 1, -1, -1):
+                e = enemies[i]
+                hits = bullet_hits(e, bullets, self._hits)
+                if hits:
+                    for proj in hits:
+                        # Pierce handling
+                        if proj.pierce_left > 0:
+                            proj.pierce_left -= 1
+                        else:
+                            release(proj)
+                    # Check if bullet is a spread pellet
+                    is_spread = proj.spread_pellet
+
+                    NERF_MULT = 0.6  # 60% damage for spread pellets
+                    base = player.damage * (NERF_MULT if is_spread else 1.0)
+                    dmg_per = base * (2 if random.random() < player.crit_chance else 1)
+                    e.hp -= dmg_per * len(hits)
+                    e.apply_status(player.burn_on_hit, player.slow_on_hit)
+                    self._hit_particles(e.center_x, e.center_y, color=HIT_SPARK)
+                    if e.hp <= 0:
+                        self._enemy_die(e)
 
         # ---------------------------
         # Player bullets vs boss
         # ---------------------------
-        if len(self.boss_list):
-            boss = self.boss_list[0]
-            hits = arcade.check_for_collision_with_list(boss, self.bullets)
+        if self.boss is not None and len(bullets):
+            boss = self.boss
+            hits = bullet_hits(boss, bullets, self._hits)
             if hits:
                 for proj in hits:
                     if proj.pierce_left > 0:
                         proj.pierce_left -= 1
                     else:
-                        proj.remove_from_sprite_lists()
-                dmg_per = self.player.damage * (2 if random.random() < self.player.crit_chance else 1)
+                        release(proj)
+                dmg_per = player.damage * (2 if random.random() < player.crit_chance else 1)
                 boss.hp -= dmg_per * len(hits)
-                self._hit_particles(boss.center_x, boss.center_y, color=arcade.color.GOLD)
+                self._hit_particles(boss.center_x, boss.center_y, color=HIT_SPARK)
                 # Combo system -> increases score multiplier if you keep hitting boss
-                self.player.combo = min(5, self.player.combo + 1)
-                self.player.combo_t = 3.0
-                self.score += 8 * self.player.combo * len(hits)
+                player.combo = min(5, player.combo + 1)
+                player.combo_t = 3.0
+                self.score += 8 * player.combo * len(hits)
                 if boss.hp <= 0:
                     self._boss_die(boss)
 
         # ---------------------------
         # Enemy bullets vs player
         # ---------------------------
-        pb = arcade.check_for_collision_with_list(self.player, self.enemy_bullets)
-        for proj in pb:
-            proj.remove_from_sprite_lists()
-            if self.player.take_hit(1):
-                self.flash_t = 0.15
-                self.shake_t = 0.12
-                if self.player.hp <= 0:
-                    self._lose()
-                    return
+        if len(self.enemy_bullets):
+            pb = bullet_hits(player, self.enemy_bullets, self._hits)
+            for proj in pb:
+                release(proj)
+                if player.take_hit(1):
+                    self.flash_t = 0.15
+                    self.shake_t = 0.12
+                    if player.hp <= 0:
+                        self._lose()
+                        return
 
         # ---------------------------
         # Player vs enemies (contact damage + knockback)
         # ---------------------------
-        for e in list(self.enemy_list):
-            if arcade.check_for_collision(self.player, e):
-                if self.player.iframes <= 0:
-                    if self.player.take_hit(1):
+        # hit_r circles only bound each hit-box polygon, so they are a cheap reject; anything
+        # that passes is confirmed with arcade's polygon test before it counts as a touch.
+        px, py = player.position
+        pr = player.hit_r
+        for i in range(len(enemies) - 1, -1, -1):
+            e = enemies[i]
+            if circles_touch(px, py, pr, e.center_x, e.center_y, e.hit_r) and arcade.check_for_collision(player, e):
+                if player.iframes <= 0:
+                    if player.take_hit(1):
                         self.flash_t = 0.15
                         self.shake_t = 0.12
-                        self.player.iframes = 2
-                        if self.player.hp <= 0:
+                        player.iframes = 2
+                        if player.hp <= 0:
                             self._lose()
                             return
                     # Knock player away from enemy
-                    ang = math.atan2(self.player.center_y - e.center_y,
-                                     self.player.center_x - e.center_x)
-                    self.player.center_x = snap(self.player.center_x + math.cos(ang) * 16)
-                    self.player.center_y = snap(self.player.center_y + math.sin(ang) * 16)
+                    dx, dy = px - e.center_x, py - e.center_y
+                    d2 = dx * dx + dy * dy
+                    if d2:
+                        k = 16 / math.sqrt(d2)
+                        dx, dy = dx * k, dy * k
+                    else:
+                        dx, dy = 16.0, 0.0  # what atan2(0, 0) used to give
+                    px, py = snap(px + dx), snap(py + dy)
+                    player.position = (px, py)
 
         # ---------------------------
         # Player vs boss (contact damage)
         # ---------------------------
-        for b in self.boss_list:
-            if arcade.check_for_collision(self.player, b):
-                if self.player.iframes <= 0:
-                    if self.player.take_hit(1):
+        b = self.boss
+        if b is not None:
+            if circles_touch(px, py, pr, b.center_x, b.center_y, b.hit_r) and arcade.check_for_collision(player, b):
+                if player.iframes <= 0:
+                    if player.take_hit(1):
                         self.flash_t = 0.15
                         self.shake_t = 0.12
-                        self.player.iframes = 2
-                        if self.player.hp <= 0:
+                        player.iframes = 2
+                        if player.hp <= 0:
                             self._lose()
                             return
 
         # ---------------------------
         # Player vs XP orbs
         # ---------------------------
-        for o in arcade.check_for_collision_with_list(self.player, self.xp_orbs):
-            o.remove_from_sprite_lists()
-            self._gain_xp(XP_ORB_VALUE)
+        orbs = self.xp_orbs
+        for i in range(len(orbs) - 1, -1, -1):
+            o = orbs[i]
+            if circles_touch(px, py, pr, o.center_x, o.center_y, o.width / 2) and arcade.check_for_collision(player, o):
+                self.orb_pool.release(o)
+                self._gain_xp(XP_ORB_VALUE)
 
         # ---------------------------
         # Player vs pickups
         # ---------------------------
-        for p in arcade.check_for_collision_with_list(self.player, self.pickups):
-            if p.kind == "health" and self.player.hp < self.player.hp_max:
-                self.player.hp += 1
-            elif p.kind == "shield":
-                self.player.shield += 1
-            p.remove_from_sprite_lists()
+        pickups = self.pickups
+        for i in range(len(pickups) - 1, -1, -1):
+            p = pickups[i]
+            if circles_touch(px, py, pr, p.center_x, p.center_y, p.width / 2) and arcade.check_for_collision(player, p):
+                if p.kind == "health" and player.hp < player.hp_max:
+                    player.hp += 1
+                elif p.kind == "shield":
+                    player.shield += 1
+                self.pickup_pool.release(p)
 
     def _enemy_die(self, e):
         """
         Enemy death:
         - Spawn particles, give score, drop XP and rare health/shield pickups.
         """
-        self._hit_particles(e.center_x, e.center_y, count=10, color=arcade.color.BANGLADESH_GREEN)
+        self._hit_particles(e.center_x, e.center_y, count=10, color=DEATH_SPARK)
         e.remove_from_sprite_lists()
         self.score += 12 * self.player.combo
-        if random.random() < 0.9:
-            self.xp_orbs.append(XPOrb(e.center_x, e.center_y))
-        if random.random() < 0.08:
-            self.pickups.append(Pickup(e.center_x, e.center_y,
-                                       "health" if random.random() < 0.6 else "shield"))
+        rnd = random.random
+        if rnd() < 0.9:
+            self.xp_orbs.append(self.orb_pool.acquire(e.center_x, e.center_y))
+        # One draw decides both the 8% drop and its 60/40 health/shield split
+        r = rnd()
+        if r < 0.08:
+            self.pickups.append(self.pickup_pool.acquire(e.center_x, e.center_y,
+                                                         "health" if r < 0.048 else "shield"))
 
     def _boss_die(self, boss):
         """
         Boss death:
         - Big explosion of particles + huge score bonus.
         """
-        for _ in range(28):
-            self._hit_particles(boss.center_x + random.uniform(-12, 12),
-                                boss.center_y + random.uniform(-12, 12),
-                                count=1, color=arcade.color.ORANGE, vel=4.0)
+        self.particles.emit(boss.center_x, boss.center_y, 28, BOSS_BLAST, 4.0, spread=18)
         boss.remove_from_sprite_lists()
+        self.boss = None
         self.score += 400
 
     def _gain_xp(self, amount):
@@ -1248,19 +1593,18 @@ class GameView(arcade.View):
         - If has_spread is True, spawn shotgun of pellets.
         - Otherwise, single bullet in facing direction.
         """
-        self.fire_timer.trigger()
+        self.fire_timer.trigger(self.clock)
         vx, vy = self.player.facing()
         pierce_left = self.player.pierce
+        px, py = self.player.position
 
         if self.player.has_spread:
-            spread = SHOTGUN_SPREAD
-            for i in range(SHOTGUN_PELLETS):
-                t = i / (SHOTGUN_PELLETS - 1) - 0.5
-                a = math.atan2(vy, vx) + spread * t
-
-                b = Bullet(
-                    self.player.center_x, self.player.center_y,
-                    math.cos(a), math.sin(a),
+            # Rotate the cached pellet offsets onto the aim direction (atan2(0, 0) aimed along +x)
+            ux, uy = (vx, vy) if vx or vy else (1.0, 0.0)
+            for fc, fs in fan_offsets(SHOTGUN_PELLETS, SHOTGUN_SPREAD):
+                b = self.bullet_pool.acquire(
+                    px, py,
+                    ux * fc - uy * fs, ux * fs + uy * fc,
                     self.player.bullet_speed,
                     BULLET_COLOR_PLAYER,
                     "player",
@@ -1271,9 +1615,9 @@ class GameView(arcade.View):
                 self.bullets.append(b)
         else:
             self.bullets.append(
-                Bullet(self.player.center_x, self.player.center_y, vx, vy,
-                       self.player.bullet_speed, BULLET_COLOR_PLAYER, "player",
-                       pierce_left=pierce_left))
+                self.bullet_pool.acquire(px, py, vx, vy,
+                                         self.player.bullet_speed, BULLET_COLOR_PLAYER, "player",
+                                         pierce_left=pierce_left))
 
     def _melee_slash(self):
         """
@@ -1282,44 +1626,39 @@ class GameView(arcade.View):
         - Applies burn/slow if player has those perks.
         - Adds score if you hit anything.
         """
-        if not self.melee_timer.ready():
+        if not self.melee_timer.ready(self.clock):
             return
-        self.melee_timer.trigger()
+        self.melee_timer.trigger(self.clock)
         hit_any = False
-        for e in list(self.enemy_list):
-            d = dist(self.player.center_x, self.player.center_y, e.center_x, e.center_y)
-            if d <= MELEE_RANGE + e.width / 2:
+        px, py = self.player.position
+        enemies = self.enemy_list
+        for i in range(len(enemies) - 1, -1, -1):
+            e = enemies[i]
+            dx, dy = e.center_x - px, e.center_y - py
+            reach = MELEE_RANGE + e.width / 2
+            if dx * dx + dy * dy <= reach * reach:
                 e.hp -= MELEE_DAMAGE
                 e.apply_status(self.player.burn_on_hit, self.player.slow_on_hit)
-                self._hit_particles(e.center_x, e.center_y, color=arcade.color.GOLD)
+                self._hit_particles(e.center_x, e.center_y, color=HIT_SPARK)
                 if e.hp <= 0:
                     self._enemy_die(e)
                 hit_any = True
         if hit_any:
             self.score += 5 * self.player.combo
-        self._hit_particles(self.player.center_x, self.player.center_y,
-                            count=6, color=arcade.color.LIGHT_CYAN)
+        self._hit_particles(px, py, count=6, color=SLASH_SPARK)
 
-    def _hit_particles(self, x, y, count=8, color=arcade.color.GOLD, vel=2.2):
+    def _hit_particles(self, x, y, count=8, color=HIT_SPARK, vel=2.2):
         """
-        Spawn particle sprites for hit/explosion effects.
+        Spawn particles for hit/explosion effects.
         - Uses a small lifetime and random velocity.
         """
-        for _ in range(count):
-            p = arcade.SpriteCircle(3, color)
-            p.center_x = x + random.uniform(-6, 6)
-            p.center_y = y + random.uniform(-6, 6)
-            p.change_x = random.uniform(-vel, vel)
-            p.change_y = random.uniform(-vel, vel)
-            p.life = 0.45
-            self.particles.append(p)
-
-    def _start_next_wave(self, dt):
+        self.particles.emit(x, y, count, color, vel)
+
+    def _start_next_wave(self):
         """
-        Scheduled callback to start the next wave after a delay.
-        - Called once wave-clear bonus was given.
+        Start the next wave once the post-clear delay (next_wave_t) runs out.
+        - Ticked from on_update, so it pauses with the game and dies with the view.
         """
-        arcade.unschedule(self._start_next_wave)
         if self.wave < TOTAL_WAVES - 1:
             self.wave += 1
             self.wave_clear_bonus_pending = False
@@ -1379,15 +1718,15 @@ class GameView(arcade.View):
         elif key == arcade.key.SPACE:
             # Keyboard shooting (hold to autofire)
             self.shoot_hold = True
-            if self.fire_timer.ready():
+            if self.fire_timer.ready(self.clock):
                 self._player_shoot()
         elif key == arcade.key.Z:
             # Melee attack
             self._melee_slash()
         elif key == arcade.key.LSHIFT:
             # Dash: teleport slightly and apply i-frames
-            if self.dash_timer.ready():
-                self.dash_timer.trigger()
+            if self.dash_timer.ready(self.clock):
+                self.dash_timer.trigger(self.clock)
                 self.player.dashing = self.player.dash_time
                 self.player.iframes = max(self.player.iframes, self.player.dash_iframe)
                 vx, vy = self.player.facing()
@@ -1425,7 +1764,7 @@ class GameView(arcade.View):
         """Mouse left = shoot (hold for autofire)."""
         if button == arcade.MOUSE_BUTTON_LEFT:
             self.shoot_hold = True
-            if self.fire_timer.ready():
+            if self.fire_timer.ready(self.clock):
                 self._player_shoot()
 
     def on_mouse_release(self, x, y, button, modifiers):